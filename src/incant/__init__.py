@@ -1,5 +1,6 @@
+from contextlib import suppress
 from functools import lru_cache
-from inspect import Parameter, Signature, iscoroutinefunction
+from inspect import Parameter, Signature
 from typing import (
     Any,
     Awaitable,
@@ -24,7 +25,13 @@ from ._codegen import (
     compile_compose,
     compile_incant_wrapper,
 )
-from ._compat import NO_OVERRIDE, Override, get_annotated_override, signature
+from ._compat import (
+    NO_OVERRIDE,
+    Override,
+    get_annotated_override,
+    iscoroutinefunction,
+    signature,
+)
 
 __all__ = ["NO_OVERRIDE", "Override", "Hook", "Incanter", "IncantError"]
 
@@ -50,12 +57,50 @@ PredicateFn = Callable[[Parameter], bool]
 
 def is_subclass(type, superclass) -> bool:
     """A safe version of `issubclass`."""
+    if (
+        not isinstance(type, _type)
+        and _type(superclass).__subclasscheck__ is _type.__subclasscheck__
+    ):
+        # Avoid raising (and swallowing) an exception in the common case.
+        # Custom `__subclasscheck__` hooks may accept non-classes, so
+        # those still go through `issubclass`.
+        return False
     try:
         return issubclass(type, superclass)
     except Exception:
         return False
 
 
+@frozen
+class _NamePredicate:
+    """Matches parameters by name, enabling lookups by name."""
+
+    name: str
+
+    def __call__(self, p: Parameter) -> bool:
+        return p.name == self.name
+
+
+@frozen
+class _TypePredicate:
+    """Matches parameters by annotation equality, enabling lookups by type."""
+
+    type: Any
+
+    def __call__(self, p: Parameter) -> bool:
+        return p.annotation == self.type
+
+
+@frozen
+class _ConstantHookFactory:
+    """A hook factory always producing the same dependency factory."""
+
+    factory: Callable
+
+    def __call__(self, _: Parameter) -> Callable:
+        return self.factory
+
+
 @frozen
 class Hook:
     predicate: PredicateFn
@@ -64,18 +109,77 @@ class Hook:
     @classmethod
     def for_name(cls, name: str, hook: Optional[Callable]) -> "Hook":
         return cls(
-            lambda p: p.name == name, None if hook is None else (lambda _: hook, None)
+            _NamePredicate(name),
+            None if hook is None else (_ConstantHookFactory(hook), None),
         )
 
     @classmethod
     def for_type(cls, type: Any, hook: Optional[Callable]) -> "Hook":
         """Register by exact type (subclasses won't match)."""
+        predicate: PredicateFn
+        try:
+            hash(type)
+            predicate = _TypePredicate(type)
+        except TypeError:
+            # Unhashable types cannot be looked up, or compared by value.
+            def predicate(p: Parameter) -> bool:
+                return p.annotation == type
+
         return cls(
-            lambda p: p.annotation == type,
-            None if hook is None else (lambda _: hook, None),
+            predicate, None if hook is None else (_ConstantHookFactory(hook), None)
         )
 
 
+@frozen
+class _HookIndex:
+    """A sequence of hooks, prepared for matching parameters.
+
+    Hooks matching by name or by type are looked up in dictionaries,
+    only the other predicates need to be tried one by one.
+    """
+
+    hooks: Sequence[Hook]
+    by_name: Dict[str, int]
+    by_type: Dict[Any, int]
+    others: List[Tuple[int, Hook]]
+
+    @classmethod
+    def for_hooks(cls, hooks: Sequence[Hook]) -> "_HookIndex":
+        by_name: Dict[str, int] = {}
+        by_type: Dict[Any, int] = {}
+        others = []
+        for ix, hook in enumerate(hooks):
+            pred = hook.predicate
+            if pred.__class__ is _NamePredicate:
+                by_name.setdefault(pred.name, ix)
+            elif pred.__class__ is _TypePredicate:
+                by_type.setdefault(pred.type, ix)
+            else:
+                others.append((ix, hook))
+        return cls(hooks, by_name, by_type, others)
+
+    def match(self, param: Parameter, start: int = 0) -> Optional[Tuple[int, Hook]]:
+        """Find the first hook (and its index) at or after `start` matching `param`."""
+        if start:
+            # Resuming after a skipped hook is rare, so just scan.
+            for ix in range(start, len(self.hooks)):
+                if self.hooks[ix].predicate(param):
+                    return ix, self.hooks[ix]
+            return None
+
+        ix = self.by_name.get(param.name, len(self.hooks))
+        if self.by_type:
+            # An unhashable annotation can only match unhashable types.
+            with suppress(TypeError):
+                ix = min(ix, self.by_type.get(param.annotation, ix))
+        for other_ix, hook in self.others:
+            if other_ix > ix:
+                break
+            if hook.predicate(param):
+                return other_ix, hook
+        return (ix, self.hooks[ix]) if ix < len(self.hooks) else None
+
+
 @define
 class Incanter:
     """A registry of _hooks_, used for function composition.
@@ -95,6 +199,7 @@ class Incanter:
             lambda self: lru_cache(None)(self._gen_incant), takes_self=True
         ),
     )
+    _hook_index: Optional[_HookIndex] = field(init=False, default=None)
 
     def compose(
         self,
@@ -117,7 +222,9 @@ class Incanter:
 
     def compose_and_call(self, fn: Callable[..., R], *args, **kwargs) -> R:
         """Compose `fn` and call it with the given parameters."""
-        return self.compose(fn, is_async=False)(*args, **kwargs)
+        # Equivalent to `self.compose(fn, is_async=False)`, without normalizing
+        # empty hooks and forced deps on every call.
+        return self._call_cache(fn, (), False, ())(*args, **kwargs)
 
     invoke = compose_and_call
 
@@ -125,7 +232,7 @@ class Incanter:
         self, fn: Callable[..., Awaitable[R]], *args, **kwargs
     ) -> R:
         """Compose `fn` as async and call it with the given parameters."""
-        return await self.compose(fn, is_async=True)(*args, **kwargs)
+        return await self._call_cache(fn, (), True, ())(*args, **kwargs)
 
     ainvoke = acompose_and_call
 
@@ -168,7 +275,7 @@ class Incanter:
 
         if name is None:
             name = fn.__name__
-        self.register_hook(lambda p: p.name == name, fn, is_ctx_manager=is_ctx_manager)
+        self.register_hook(_NamePredicate(name), fn, is_ctx_manager=is_ctx_manager)
         return fn
 
     def register_by_type(
@@ -226,6 +333,14 @@ class Incanter:
         self.hook_factory_registry.insert(
             0, Hook(predicate, (hook_factory, is_ctx_manager))
         )
+        self._hook_index = None
+        self._call_cache.cache_clear()  # type: ignore
+        self._incant_cache.cache_clear()  # type: ignore
+
+    def reset(self) -> None:
+        """Remove all registered hooks and clear all caches."""
+        self.hook_factory_registry.clear()
+        self._hook_index = None
         self._call_cache.cache_clear()  # type: ignore
         self._incant_cache.cache_clear()  # type: ignore
 
@@ -246,6 +361,10 @@ class Incanter:
                 for k, v in kwargs.items()
             ]
         )
+        plan = self._gen_incant_plan(fn, pos_args, dict(kwargs_by_name_and_pred))
+        if _is_passthrough_plan(fn, plan, len(args), kwargs):
+            # The arguments line up with the parameters, so skip the wrapper.
+            return fn(*args, **kwargs)
         wrapper = self._incant_cache(fn, pos_args, kwargs_by_name_and_pred)
 
         return wrapper(*args, **kwargs)
@@ -311,7 +430,16 @@ class Incanter:
         """
         to_process = [(fn, None), *forced_deps]
         final_nodes: List[Tuple[Callable, Optional[CtxManagerKind], List[Dep]]] = []
-        hooks = list(additional_hooks) + self.hook_factory_registry
+        if additional_hooks:
+            hooks = _HookIndex.for_hooks(
+                [*additional_hooks, *self.hook_factory_registry]
+            )
+        else:
+            if self._hook_index is None:
+                self._hook_index = _HookIndex.for_hooks(
+                    tuple(self.hook_factory_registry)
+                )
+            hooks = self._hook_index
         already_processed_hooks = set()
         while to_process:
             _nodes = to_process
@@ -328,26 +456,27 @@ class Incanter:
                         # Do not expose optional kw-only params of dependencies.
                         continue
                     param_type = param.annotation
-                    for hook in hooks:
-                        if hook.predicate(param):
-                            # Match!
-                            if hook.factory is None:
-                                dependents.append(
-                                    ParameterDep(name, param_type, param.default)
-                                )
-                            else:
-                                factory = hook.factory[0](param)
-                                if factory == node:
-                                    # A hook cannot satisfy itself.
-                                    continue
-                                if factory not in already_processed_hooks:
-                                    to_process.append((factory, hook.factory[1]))
-                                    already_processed_hooks.add(factory)
-                                dependents.append(
-                                    FactoryDep(factory, name, hook.factory[1])
-                                )
-
-                            break
+                    start = 0
+                    while (match := hooks.match(param, start)) is not None:
+                        ix, hook = match
+                        if hook.factory is None:
+                            dependents.append(
+                                ParameterDep(name, param_type, param.default)
+                            )
+                        else:
+                            factory = hook.factory[0](param)
+                            if factory == node:
+                                # A hook cannot satisfy itself.
+                                start = ix + 1
+                                continue
+                            if factory not in already_processed_hooks:
+                                to_process.append((factory, hook.factory[1]))
+                                already_processed_hooks.add(factory)
+                            dependents.append(
+                                FactoryDep(factory, name, hook.factory[1])
+                            )
+
+                        break
                     else:
                         dependents.append(ParameterDep(name, param_type, param.default))
                 final_nodes.insert(0, (node, ctx_mgr_kind, dependents))
@@ -461,6 +590,24 @@ class Incanter:
         )
 
 
+def _is_passthrough_plan(
+    fn: Callable, plan: List[Union[int, str]], num_pos_args: int, kwargs: Dict
+) -> bool:
+    """Can `fn` be called with the arguments directly, instead of through `plan`?"""
+    params = signature(fn).parameters
+    by_name = plan[num_pos_args:]
+    return (
+        len(plan) == len(params)
+        and plan[:num_pos_args] == list(range(num_pos_args))
+        and len(by_name) == len(kwargs)
+        and set(by_name) == kwargs.keys()
+        and all(
+            params[name].kind is not Parameter.POSITIONAL_ONLY  # type: ignore
+            for name in by_name
+        )
+    )
+
+
 def _reconcile_types(type_a, type_b):
     if type_a is Signature.empty:
         return type_b
@@ -1,5 +1,5 @@
 import linecache
-from inspect import Signature, iscoroutinefunction
+from inspect import Parameter, Signature
 from typing import (
     Any,
     Callable,
@@ -15,10 +15,10 @@ from typing import (
 
 from attrs import define
 
-from ._compat import signature
+from ._compat import iscoroutinefunction, signature
 
 
-@define
+@define(eq=False)
 class ParameterDep:
     arg_name: str
     type: Any
@@ -28,7 +28,7 @@ class ParameterDep:
 CtxManagerKind = Literal["sync", "async"]
 
 
-@define
+@define(eq=False)
 class Invocation:
     """Produce an invocation (and possibly a local var) in a generated function."""
 
@@ -57,27 +57,7 @@ def compile_compose(
     sig = signature(fn)
     fn_name = f"invoke_{fn.__name__}" if fn.__name__ != "<lambda>" else "invoke_lambda"
     globs: Dict[str, Any] = {}
-    arg_lines = []
-
-    for dep in outer_args:
-        if dep.type is not Signature.empty:
-            # Some types, like new unions (`int|str`), do not have names.
-            if (type_name := getattr(dep.type, "__name__", None)) and (
-                type_name not in globs or globs[type_name] is dep.type
-            ):
-                arg_type_snippet = f": {type_name}"
-                globs[type_name] = dep.type
-            else:
-                arg_type_snippet = f": _incant_arg_{dep.arg_name}"
-                globs[f"_incant_arg_{dep.arg_name}"] = dep.type
-        else:
-            arg_type_snippet = ""
-        if dep.default is not Signature.empty:
-            arg_default = f"_incant_default_{dep.arg_name}"
-            arg_type_snippet = f"{arg_type_snippet} = {arg_default}"
-            globs[arg_default] = dep.default
-
-        arg_lines.append(f"{dep.arg_name}{arg_type_snippet}")
+    args_src = ", ".join([_render_arg(dep, globs) for dep in outer_args])
     outer_arg_names = {o.arg_name for o in outer_args}
 
     lines = []
@@ -91,10 +71,7 @@ def compile_compose(
             tn = "_incant_return_type"
         globs[tn] = sig.return_annotation
         ret_type = f" -> {tn}"
-    if is_async:
-        lines.append(f"async def {fn_name}({', '.join(arg_lines)}){ret_type}:")
-    else:
-        lines.append(f"def {fn_name}({', '.join(arg_lines)}){ret_type}:")
+    lines.append(f"{'async ' if is_async else ''}def {fn_name}({args_src}){ret_type}:")
 
     local_vars_ix_by_factory = {
         local_var.factory: ix for ix, local_var in enumerate(invocations)
@@ -220,7 +197,46 @@ def compile_compose(
     fname = _generate_unique_filename(fn.__name__, "invoke", lines)
     eval(compile(script, fname, "exec"), globs)
 
-    return globs[fn_name]
+    res = globs[fn_name]
+    # We already know the signature, so spare `inspect.signature` the work.
+    res.__signature__ = Signature(
+        [
+            Parameter(
+                dep.arg_name,
+                Parameter.POSITIONAL_OR_KEYWORD,
+                default=dep.default,
+                annotation=dep.type,
+            )
+            for dep in outer_args
+        ],
+        return_annotation=sig.return_annotation,
+    )
+    return res
+
+
+def _render_arg(dep: ParameterDep, globs: Dict[str, Any]) -> str:
+    """Render an argument of a generated function.
+
+    Any annotations and defaults the argument needs are added to `globs`.
+    """
+    if dep.type is not Signature.empty:
+        # Some types, like new unions (`int|str`), do not have names.
+        if (type_name := getattr(dep.type, "__name__", None)) and (
+            type_name not in globs or globs[type_name] is dep.type
+        ):
+            arg_type_snippet = f": {type_name}"
+            globs[type_name] = dep.type
+        else:
+            arg_type_snippet = f": _incant_arg_{dep.arg_name}"
+            globs[f"_incant_arg_{dep.arg_name}"] = dep.type
+    else:
+        arg_type_snippet = ""
+    if dep.default is not Signature.empty:
+        arg_default = f"_incant_default_{dep.arg_name}"
+        arg_type_snippet = f"{arg_type_snippet} = {arg_default}"
+        globs[arg_default] = dep.default
+
+    return f"{dep.arg_name}{arg_type_snippet}"
 
 
 def compile_incant_wrapper(
@@ -237,15 +253,16 @@ def compile_incant_wrapper(
     if num_kwargs > len(kwargs):
         arg_lines.append("**kwargs")
 
-    lines = []
-    lines.append(f"def {fn_name}({', '.join(arg_lines)}):")
-    lines.append("  return _incant_inner_fn(")
-    for arg in incant_plan:
-        if isinstance(arg, int):
-            lines.append(f"    args[{arg}],")
-        else:
-            lines.append(f"    {arg},")
-    lines.append("  )")
+    # The number of lines is known upfront, so build the list in one go.
+    lines = [
+        f"def {fn_name}({', '.join(arg_lines)}):",
+        "  return _incant_inner_fn(",
+        *[
+            f"    args[{arg}]," if isinstance(arg, int) else f"    {arg},"
+            for arg in incant_plan
+        ],
+        "  )",
+    ]
 
     script = "\n".join(lines)
 
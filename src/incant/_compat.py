@@ -1,8 +1,10 @@
 import sys
-from functools import partial
-from inspect import Parameter
+from functools import lru_cache, partial
+from inspect import Parameter, Signature
+from inspect import iscoroutinefunction as _iscoroutinefunction
 from inspect import signature as sig
-from typing import Any, Optional
+from typing import Any, Callable, Optional
+from weakref import WeakKeyDictionary
 
 from attr import frozen
 
@@ -22,21 +24,69 @@ else:
     from typing_extensions import _AnnotatedAlias
 
 if sys.version_info >= (3, 10):
-    signature = partial(sig, eval_str=True)
+    _signature = partial(sig, eval_str=True)
 
 else:
-    signature = sig
+    _signature = sig
+
+_signatures: "WeakKeyDictionary[Callable, Signature]" = WeakKeyDictionary()
+
+
+def signature(fn: Callable) -> Signature:
+    """Get the signature of `fn`, evaluating string annotations if supported.
+
+    Signatures are cached, since producing them (and evaluating string
+    annotations especially) is expensive.
+    """
+    try:
+        return _signatures[fn]
+    except KeyError:
+        res = _signatures[fn] = _signature(fn)
+        return res
+    except TypeError:
+        # Not hashable or weak-referenceable, so cannot be cached.
+        return _signature(fn)
+
+
+_coroutine_fns: "WeakKeyDictionary[Callable, bool]" = WeakKeyDictionary()
+
+
+def iscoroutinefunction(fn: Callable) -> bool:
+    """A cached version of `inspect.iscoroutinefunction`."""
+    try:
+        return _coroutine_fns[fn]
+    except KeyError:
+        res = _coroutine_fns[fn] = _iscoroutinefunction(fn)
+        return res
+    except TypeError:
+        # Not hashable or weak-referenceable, so cannot be cached.
+        return _iscoroutinefunction(fn)
 
 
 def get_annotated_override(p: Parameter) -> Parameter:
     if p.annotation.__class__ is _AnnotatedAlias:
-        for arg in p.annotation.__metadata__:
-            if isinstance(arg, Override):
-                name = arg.name if arg.name is not None else p.name
-                an = (
-                    arg.annotation
-                    if arg.annotation is not NO_OVERRIDE
-                    else p.annotation
-                )
-                return Parameter(name, p.kind, default=p.default, annotation=an)
+        try:
+            override = _cached_find_override(p.annotation)
+        except TypeError:
+            # Unhashable metadata, cannot be cached.
+            override = _find_override(p.annotation)
+        if override is not None:
+            name = override.name if override.name is not None else p.name
+            an = (
+                override.annotation
+                if override.annotation is not NO_OVERRIDE
+                else p.annotation
+            )
+            return Parameter(name, p.kind, default=p.default, annotation=an)
     return p
+
+
+def _find_override(annotation: Any) -> Optional[Override]:
+    """Find the first `Override` in the metadata of an `Annotated` type."""
+    for arg in annotation.__metadata__:
+        if isinstance(arg, Override):
+            return arg
+    return None
+
+
+_cached_find_override = lru_cache(maxsize=1024)(_find_override)
@@ -2,6 +2,13 @@ from incant import Incanter
 from pytest import fixture
 
 
-@fixture
-def incanter() -> Incanter:
+@fixture(scope="module")
+def _module_incanter() -> Incanter:
     return Incanter()
+
+
+@fixture
+def incanter(_module_incanter: Incanter) -> Incanter:
+    """A shared incanter, reset for every test."""
+    _module_incanter.reset()
+    return _module_incanter
@@ -11,6 +11,17 @@ import pytest
 from attrs import define
 from incant import Incanter, IncantError
 
+_P_INPUT = Parameter("input", Parameter.POSITIONAL_OR_KEYWORD)
+_P_INPUT_FLOAT = Parameter("input", Parameter.POSITIONAL_OR_KEYWORD, annotation=float)
+
+
+def _two() -> int:
+    return 2
+
+
+def _inc_dep(dep):
+    return dep + 1
+
 
 def test_simple_dep(incanter: Incanter):
     def func(dep1) -> int:
@@ -22,16 +33,17 @@ def test_simple_dep(incanter: Incanter):
         "dep1": Parameter("dep1", Parameter.POSITIONAL_OR_KEYWORD)
     }
 
-    incanter.register_hook(lambda p: p.name == "dep1", lambda: 2)
+    incanter.register_hook(lambda p: p.name == "dep1", _two)
     assert incanter.compose_and_call(func) == 3
 
-    assert signature(incanter.compose(func)).parameters == {}
-    assert signature(incanter.compose(func)).return_annotation is int
+    sig = signature(incanter.compose(func))
+    assert sig.parameters == {}
+    assert sig.return_annotation is int
 
 
 def test_nested_deps(incanter: Incanter):
-    incanter.register_hook(lambda p: p.name == "dep1", lambda dep2: dep2 + 1)
-    incanter.register_hook(lambda p: p.name == "dep2", lambda: 2)
+    incanter.register_by_name(lambda dep2: dep2 + 1, name="dep1")
+    incanter.register_by_name(_two, name="dep2")
 
     def func(dep1):
         return dep1 + 1
@@ -41,32 +53,26 @@ def test_nested_deps(incanter: Incanter):
 
 
 def test_nested_partial_deps(incanter: Incanter):
-    incanter.register_hook(
-        lambda p: p.name == "dep1", lambda dep2, input: dep2 + input + 1
-    )
-    incanter.register_hook(lambda p: p.name == "dep2", lambda: 2)
+    incanter.register_by_name(lambda dep2, input: dep2 + input + 1, name="dep1")
+    incanter.register_by_name(_two, name="dep2")
 
     def func(dep1):
         return dep1 + 1
 
-    assert signature(incanter.compose(func)).parameters == {
-        "input": Parameter("input", Parameter.POSITIONAL_OR_KEYWORD)
-    }
+    assert signature(incanter.compose(func)).parameters == {"input": _P_INPUT}
     assert incanter.compose_and_call(func, 1) == 5
 
 
 def test_nested_partial_deps_with_args(incanter: Incanter):
-    incanter.register_hook(
-        lambda p: p.name == "dep1", lambda dep2, input: dep2 + input + 1
-    )
-    incanter.register_hook(lambda p: p.name == "dep2", lambda: 2)
+    incanter.register_by_name(lambda dep2, input: dep2 + input + 1, name="dep1")
+    incanter.register_by_name(_two, name="dep2")
 
     def func(dep1, input2: float) -> float:
         return dep1 + 1 + input2
 
     assert signature(incanter.compose(func)).parameters == OrderedDict(
         [
-            ("input", Parameter("input", Parameter.POSITIONAL_OR_KEYWORD)),
+            ("input", _P_INPUT),
             (
                 "input2",
                 Parameter("input2", Parameter.POSITIONAL_OR_KEYWORD, annotation=float),
@@ -89,17 +95,14 @@ def test_nested_partial_deps_with_coalesce(incanter: Incanter):
 
 def test_shared_params(incanter: Incanter):
     incanter.register_by_name(lambda dep2, input: dep2 + input + 1, name="dep1")
-    incanter.register_by_name(lambda: 2, name="dep2")
+    incanter.register_by_name(_two, name="dep2")
 
     def func(dep1, input: float) -> float:
         return dep1 + 1 + input
 
     assert signature(incanter.compose(func)).parameters == OrderedDict(
         [
-            (
-                "input",
-                Parameter("input", Parameter.POSITIONAL_OR_KEYWORD, annotation=float),
-            ),
+            ("input", _P_INPUT_FLOAT),
         ]
     )
     assert incanter.compose_and_call(func, 5.0) == 14.0
@@ -112,17 +115,14 @@ def test_shared_deps_type_from_dep(incanter: Incanter):
     def dep1(dep2, input: float):
         return dep2 + input + 1
 
-    incanter.register_by_name(lambda: 2, name="dep2")
+    incanter.register_by_name(_two, name="dep2")
 
     def func(dep1, input) -> float:
         return dep1 + 1 + input
 
     assert signature(incanter.compose(func)).parameters == OrderedDict(
         [
-            (
-                "input",
-                Parameter("input", Parameter.POSITIONAL_OR_KEYWORD, annotation=float),
-            ),
+            ("input", _P_INPUT_FLOAT),
         ]
     )
     assert incanter.compose_and_call(func, 5.0) == 14.0
@@ -134,8 +134,8 @@ def test_shared_deps_incompatible(incanter: Incanter):
     def dep1(dep2, input: str) -> str:
         return dep2 + input + "1"
 
-    incanter.register_hook(lambda p: p.name == "dep1", dep1)
-    incanter.register_hook(lambda p: p.name == "dep2", lambda: 2)
+    incanter.register_by_name(dep1)
+    incanter.register_by_name(_two, name="dep2")
 
     def func(dep1, input: float) -> float:
         return dep1 + 1 + input
@@ -152,7 +152,7 @@ def test_class_deps(incanter: Incanter):
     class Dep:
         a: int
 
-    incanter.register_hook(lambda p: p.name == "dep", Dep)
+    incanter.register_by_name(Dep, name="dep")
     assert incanter.compose_and_call(lambda dep: dep.a + 1, a=1)
 
     assert signature(incanter.compose(lambda dep: dep.a + 1)).parameters == OrderedDict(
@@ -182,9 +182,9 @@ def test_optional_arg(incanter: Incanter):
     def dep(i=1):
         return i
 
-    assert incanter.compose_and_call(lambda dep: dep + 1) == 2
-    assert incanter.compose_and_call(lambda dep: dep + 1, 2) == 3
-    assert signature(incanter.compose(lambda dep: dep + 1)).parameters == {
+    assert incanter.compose_and_call(_inc_dep) == 2
+    assert incanter.compose_and_call(_inc_dep, 2) == 3
+    assert signature(incanter.compose(_inc_dep)).parameters == {
         "i": Parameter("i", Parameter.POSITIONAL_OR_KEYWORD, default=1)
     }
 
@@ -215,8 +215,9 @@ def test_shared_deps(incanter: Incanter) -> None:
     assert incanter.compose_and_call(fn) == 15
 
 
-def test_ctx_manager_dep(incanter: Incanter):
-    """Context manager dependencies work."""
+@pytest.mark.parametrize("forced", [False, True])
+def test_ctx_manager_dep(incanter: Incanter, forced: bool):
+    """Context manager dependencies work, forced or not."""
     entered, exited = False, False
 
     @incanter.register_by_name(is_ctx_manager="sync")
@@ -232,38 +233,17 @@ def test_ctx_manager_dep(incanter: Incanter):
         exited = True
 
     def fn(dep1: int) -> int:
-        nonlocal entered
         assert entered
         return dep1 + 1
 
-    assert incanter.compose_and_call(fn) == 2
-
-    assert entered
-    assert exited
-
-
-def test_forced_ctx_manager_dep(incanter: Incanter):
-    """Forced context manager dependencies work."""
-    entered, exited = False, False
-
-    @incanter.register_by_name(is_ctx_manager="sync")
-    @contextmanager
-    def dep1():
-        nonlocal entered, exited
-        assert not entered
-        assert not exited
-        entered = True
-        yield 1
-        assert entered
-        assert not exited
-        exited = True
-
-    def fn(i: int) -> int:
-        nonlocal entered
+    def forced_fn(i: int) -> int:
         assert entered
         return i + 1
 
-    assert incanter.compose(fn, forced_deps=[(dep1, "sync")])(1) == 2
+    if forced:
+        assert incanter.compose(forced_fn, forced_deps=[(dep1, "sync")])(1) == 2
+    else:
+        assert incanter.compose_and_call(fn) == 2
 
     assert entered
     assert exited
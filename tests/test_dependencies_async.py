@@ -1,49 +1,38 @@
 from asyncio import sleep
-from collections import OrderedDict
 from contextlib import asynccontextmanager
 from inspect import Parameter, signature
 
 import pytest
 from incant import Incanter
-from quattro import TaskGroup
+
+
+def _inc_dep1(dep1):
+    return dep1 + 1
 
 
 async def test_async_invoke(incanter: Incanter):
     async def fn():
-        await sleep(0.001)
+        await sleep(0)
         return 2
 
     assert (await incanter.acompose_and_call(fn)) == 2
 
 
-async def test_async_dep(incanter: Incanter):
-    @incanter.register_by_name
-    async def dep1() -> int:
-        return 1
-
-    with pytest.raises(TypeError):
-        incanter.compose_and_call(lambda dep1: dep1 + 1)
-
-    assert (await incanter.acompose_and_call(lambda dep1: dep1 + 1)) == 2
-    assert signature(
-        incanter.compose(lambda dep1: dep1 + 1, is_async=True)
-    ).parameters == OrderedDict([])
-
-
-async def test_async_dep_invoke(incanter: Incanter):
-    """Same as `test_async_dep`, except use the aliases."""
+@pytest.mark.parametrize(
+    "call, acall", [("compose_and_call", "acompose_and_call"), ("invoke", "ainvoke")]
+)
+async def test_async_dep(incanter: Incanter, call: str, acall: str):
+    """Async dependencies work, through the methods and their aliases."""
 
     @incanter.register_by_name
     async def dep1() -> int:
         return 1
 
     with pytest.raises(TypeError):
-        incanter.invoke(lambda dep1: dep1 + 1)
+        getattr(incanter, call)(_inc_dep1)
 
-    assert (await incanter.ainvoke(lambda dep1: dep1 + 1)) == 2
-    assert signature(
-        incanter.compose(lambda dep1: dep1 + 1, is_async=True)
-    ).parameters == OrderedDict([])
+    assert (await getattr(incanter, acall)(_inc_dep1)) == 2
+    assert signature(incanter.compose(_inc_dep1, is_async=True)).parameters == {}
 
 
 async def test_async_mixed_dep(incanter: Incanter):
@@ -56,14 +45,12 @@ async def test_async_mixed_dep(incanter: Incanter):
         return input + 1
 
     with pytest.raises(TypeError):
-        incanter.compose_and_call(lambda dep1: dep1 + 1, 1)
+        incanter.compose_and_call(_inc_dep1, 1)
 
-    assert (await incanter.acompose_and_call(lambda dep1: dep1 + 1, 1)) == 4
-    assert signature(
-        incanter.compose(lambda dep1: dep1 + 1, is_async=True)
-    ).parameters == OrderedDict(
-        [("input", Parameter("input", Parameter.POSITIONAL_OR_KEYWORD, annotation=int))]
-    )
+    assert (await incanter.acompose_and_call(_inc_dep1, 1)) == 4
+    assert signature(incanter.compose(_inc_dep1, is_async=True)).parameters == {
+        "input": Parameter("input", Parameter.POSITIONAL_OR_KEYWORD, annotation=int)
+    }
 
 
 async def test_async_ctx_manager_dep(incanter: Incanter):
@@ -90,6 +77,8 @@ async def test_async_ctx_manager_dep(incanter: Incanter):
 
 async def test_taskgroup_dep(incanter: Incanter):
     """Async context manager dependencies work."""
+    from quattro import TaskGroup
+
     incanter.register_by_type(TaskGroup, is_ctx_manager="async")
 
     async def fn(tg: TaskGroup):
@@ -1,4 +1,5 @@
-from typing import Literal
+from inspect import signature
+from typing import Literal, Tuple
 
 import pytest
 from incant import Incanter
@@ -86,9 +87,55 @@ def test_kwargs_subclasses(incanter: Incanter) -> None:
 def test_adapt(incanter: Incanter):
     """Simple cases of adapt work."""
 
-    def func(x: Literal[0]) -> int:
+    lit0 = Literal[0]
+
+    def func(x: lit0) -> int:
         return x + 1
 
-    adapted = incanter.adapt(func, lambda p: p.annotation == Literal[0])
+    adapted = incanter.adapt(func, lambda p: p.annotation == lit0)
 
     assert adapted(0) == 1
+
+
+def test_incant_passthrough(incanter: Incanter):
+    """Incanting skips the wrapper when arguments can be forwarded as-is."""
+
+    def func(x: int, y: str) -> str:
+        return f"{x}{y}"
+
+    assert incanter.incant(func, 1, "a") == "1a"
+    assert incanter.incant(func, y="a", x=1) == "1a"
+    assert incanter._incant_cache.cache_info().currsize == 0  # type: ignore
+
+    assert incanter.incant(func, "a", 1) == "1a"
+    assert incanter._incant_cache.cache_info().currsize == 1  # type: ignore
+
+
+def test_adapt_positional_only(incanter: Incanter):
+    """Positional-only parameters can still be adapted by keyword."""
+
+    def func(x: int, /) -> int:
+        return x
+
+    assert incanter.incant(func, x=1) == 1
+    assert incanter.adapt(func, x=lambda p: p.name == "x")(x=1) == 1
+
+
+def test_adapt_extra_positional_args(incanter: Incanter):
+    """Adapted functions ignore extra positional arguments."""
+
+    def func(x: int) -> int:
+        return x
+
+    def func_with_default(x: int, y: int = 5) -> Tuple[int, int]:
+        return x, y
+
+    def is_x(p):
+        return p.name == "x"
+
+    adapted = incanter.adapt(func, is_x)
+    assert adapted is not func
+    assert adapted(1, 2) == 1
+    assert str(signature(adapted)) == "(*args)"
+
+    assert incanter.adapt(func_with_default, is_x)(1, 2) == (1, 5)
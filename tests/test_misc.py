@@ -1,7 +1,67 @@
-from incant import is_subclass
+from typing import List, NewType
+
+from incant import Incanter, is_subclass
 
 
 def test_is_subclass() -> None:
     """Our version of issubclass is safe."""
     # This would have been an exception in the original issubclass.
     assert not is_subclass(int, 1)
+    assert not is_subclass(1, int)
+    assert not is_subclass(List[int], list)
+    assert is_subclass(bool, int)
+
+
+def test_is_subclass_custom_check(incanter: Incanter) -> None:
+    """Custom subclass checks are used, even for non-classes."""
+
+    class IntLikeMeta(type):
+        def __subclasscheck__(cls, subclass) -> bool:
+            return getattr(subclass, "__supertype__", None) is int
+
+    class IntLike(metaclass=IntLikeMeta):
+        pass
+
+    UserId = NewType("UserId", int)
+
+    assert is_subclass(UserId, IntLike)
+
+    def func(x: UserId) -> int:
+        return x
+
+    incanter.register_by_type(lambda: 7, IntLike)
+    assert incanter.compose_and_call(func) == 7
+
+
+def test_reset(incanter: Incanter) -> None:
+    """Resetting an incanter removes its hooks."""
+
+    def func(dep1: int) -> int:
+        return dep1 + 1
+
+    incanter.register_by_name(lambda: 1, name="dep1")
+    assert incanter.compose_and_call(func) == 2
+
+    incanter.reset()
+
+    assert incanter.compose(func) is func
+
+
+def test_register_after_compose(incanter: Incanter) -> None:
+    """Hooks registered after composing are picked up."""
+
+    def func(dep1: int) -> int:
+        return dep1 + 1
+
+    incanter.register_by_name(lambda: 1, name="dep1")
+    assert incanter.compose_and_call(func) == 2
+
+    incanter.register_by_type(lambda: 2, int)
+    assert incanter.compose_and_call(func) == 3
+
+
+def test_builtin_functions(incanter: Incanter) -> None:
+    """Functions that cannot be weakly referenced can be composed."""
+    incanter.register_by_name(lambda: [1, 2], name="obj")
+
+    assert incanter.compose_and_call(len) == 2
@@ -18,14 +18,70 @@ def test_simple_override(incanter: Incanter):
 
     additional_hooks = [Hook.for_name("dep1", lambda: 0)]
 
-    assert incanter.compose(fn, additional_hooks)() == 1
-    assert incanter.compose(fn, additional_hooks)() == 1
-    assert incanter.compose(fn, additional_hooks)() == 1
+    prepared = incanter.compose(fn, additional_hooks)
+    assert prepared() == 1
+    assert prepared() == 1
+    # Composing again with the same hooks reuses the composition.
+    assert incanter.compose(fn, additional_hooks) is prepared
 
     additional_hooks = [Hook.for_type(int, lambda: 10)]
 
-    assert incanter.compose(fn, additional_hooks)() == 11
-    assert incanter.compose(fn, additional_hooks)() == 11
+    prepared = incanter.compose(fn, additional_hooks)
+    assert prepared() == 11
+    assert prepared() == 11
+
+
+def test_equal_hooks(incanter: Incanter):
+    """Hooks created separately for the same factory share compositions."""
+
+    def dep() -> int:
+        return 0
+
+    def fn(dep1: int):
+        return dep1 + 1
+
+    assert Hook.for_name("dep1", dep) == Hook.for_name("dep1", dep)
+    assert Hook.for_name("dep1", dep) != Hook.for_name("dep1", lambda: 0)
+    assert Hook.for_type(int, dep) == Hook.for_type(int, dep)
+
+    prepared = incanter.compose(fn, [Hook.for_name("dep1", dep)])
+    assert incanter.compose(fn, [Hook.for_name("dep1", dep)]) is prepared
+    assert prepared() == 1
+
+
+def test_unhashable_type_hooks(incanter: Incanter):
+    """Hooks for unhashable types work."""
+    unhashable = Annotated[int, {}]
+
+    def fn(dep1: unhashable):
+        return dep1 + 1
+
+    assert incanter.compose(fn, [Hook.for_type(unhashable, lambda: 1)])() == 2
+
+
+def test_hook_order(incanter: Incanter):
+    """Additional hooks are tried in order, whatever their kind."""
+
+    def fn(dep1: int):
+        return dep1 + 1
+
+    assert (
+        incanter.compose(
+            fn,
+            [
+                Hook(lambda p: p.name == "dep1", (lambda _: lambda: 1, None)),
+                Hook.for_name("dep1", lambda: 2),
+                Hook.for_type(int, lambda: 3),
+            ],
+        )()
+        == 2
+    )
+    assert (
+        incanter.compose(
+            fn, [Hook.for_type(int, lambda: 3), Hook.for_name("dep1", lambda: 2)]
+        )()
+        == 4
+    )
 
 
 def test_override_to_parameter(incanter: Incanter):
@@ -63,3 +119,13 @@ def test_individial_param_overriding_type(incanter: Incanter):
         return dep1
 
     assert incanter.compose_and_call(fn) == 5
+
+
+def test_param_overriding_unhashable_metadata(incanter: Incanter):
+    """Overrides work alongside unhashable metadata."""
+    incanter.register_by_type(lambda: 5, type=int)
+
+    def fn(dep1: Annotated[str, {"unhashable": True}, Override(annotation=int)]):
+        return dep1
+
+    assert incanter.compose_and_call(fn) == 5
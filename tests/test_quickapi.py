@@ -1,75 +1,125 @@
-"""Tests for the quickapi module."""
-from asyncio import create_task, sleep
+"""Tests for the quickapi module.
+
+uvicorn, httpx and the app are imported in the fixtures, to keep them out of
+test collection.
+"""
+from __future__ import annotations
+
+from asyncio import gather
 from sys import version_info
-from time import perf_counter
+from threading import Thread
+from time import perf_counter, sleep
+from typing import TYPE_CHECKING
 
 import pytest
-from httpx import AsyncClient
-from uvicorn import Config, Server
 
-from .quickapi import app
+if TYPE_CHECKING:
+    from httpx import AsyncClient
 
 
-class UvicornTestServer(Server):
-    def install_signal_handlers(self) -> None:
-        return
+@pytest.fixture(scope="module")
+def quickapi_server(unused_tcp_port_factory):
+    """Serve the app from a background thread, shared by the whole module.
 
+    The server runs its own event loop, so it's independent of the
+    per-test event loops.
+    """
+    from uvicorn import Config, Server
+
+    from .quickapi import app
+
+    class UvicornTestServer(Server):
+        def install_signal_handlers(self) -> None:
+            return
 
-@pytest.fixture
-async def quickapi_server(unused_tcp_port_factory):
     port = unused_tcp_port_factory()
     s = UvicornTestServer(Config(app=app, port=port))
-    _ = create_task(s.serve())  # noqa: RUF006
+    errors: list[BaseException] = []
+
+    def run() -> None:
+        try:
+            s.run()
+        except BaseException as exc:
+            # uvicorn exits on startup errors, which would end the session.
+            errors.append(exc)
+
+    def raise_errors() -> None:
+        if errors:
+            raise RuntimeError("The server crashed") from errors[0]
+
+    serving = Thread(target=run, daemon=True)
+    serving.start()
+    deadline = perf_counter() + 5.0
+    while not s.started:
+        raise_errors()
+        assert serving.is_alive(), "The server failed to start"
+        assert perf_counter() < deadline, "The server did not start in time"
+        sleep(0.01)
     yield f"http://localhost:{port}"
     s.should_exit = True
-    await sleep(0.2)
+    serving.join(2.0)
+    assert not serving.is_alive(), "The server did not shut down in time"
+    raise_errors()
+
 
+@pytest.fixture
+async def client():
+    from httpx import AsyncClient
 
-async def test_index(quickapi_server: str):
     async with AsyncClient() as client:
-        resp = (await client.get(f"{quickapi_server}/")).text
-        assert resp == "OK"
+        yield client
 
 
-async def test_async_context_manager(quickapi_server: str):
-    async with AsyncClient() as client:
-        resp = (await client.get(f"{quickapi_server}/taskgroup")).text
-        assert resp == "nice"
+async def test_index(quickapi_server: str, client: AsyncClient):
+    resp = (await client.get(f"{quickapi_server}/")).text
+    assert resp == "OK"
 
 
-async def test_payload_handler(quickapi_server: str):
-    async with AsyncClient() as client:
-        resp = (await client.get(f"{quickapi_server}/header")).text
-        assert resp == "The header was: none"
+async def test_async_context_manager(quickapi_server: str, client: AsyncClient):
+    resp = (await client.get(f"{quickapi_server}/taskgroup")).text
+    assert resp == "nice"
 
-        resp = (
-            await client.post(f"{quickapi_server}/payload", content=b'{"field": 1}')
-        ).text
-        assert resp == "After payload"
 
+async def test_payload_handler(quickapi_server: str, client: AsyncClient):
+    resp = (await client.get(f"{quickapi_server}/header")).text
+    assert resp == "The header was: none"
 
-async def test_header_handler(quickapi_server: str):
-    async with AsyncClient() as client:
-        resp = (await client.get(f"{quickapi_server}/header")).text
-        assert resp == "The header was: none"
+    resp = (
+        await client.post(f"{quickapi_server}/payload", content=b'{"field": 1}')
+    ).text
+    assert resp == "After payload"
+
+
+async def test_header_handler(quickapi_server: str, client: AsyncClient):
+    resp = (await client.get(f"{quickapi_server}/header")).text
+    assert resp == "The header was: none"
 
-        resp = (
-            await client.get(
-                f"{quickapi_server}/header", headers={"content-type": "test"}
-            )
-        ).text
-        assert resp == "The header was: test"
+    resp = (
+        await client.get(f"{quickapi_server}/header", headers={"content-type": "test"})
+    ).text
+    assert resp == "The header was: test"
+
+
+async def test_concurrent_requests(quickapi_server: str, client: AsyncClient):
+    """Independent endpoints can be requested concurrently."""
+    index, header, payload = await gather(
+        client.get(f"{quickapi_server}/"),
+        client.get(f"{quickapi_server}/header"),
+        client.post(f"{quickapi_server}/payload", content=b'{"field": 1}'),
+    )
+    assert index.text == "OK"
+    assert header.text == "The header was: none"
+    assert payload.text == "After payload"
 
 
 @pytest.mark.skipif(
     version_info[:2] <= (3, 8), reason="Quattro cancellation not supported on 3.8"
 )
-async def test_timeout(quickapi_server: str):
-    async with AsyncClient() as client:
-        start = perf_counter()
-        resp = await client.get(
-            f"{quickapi_server}/slow", headers={"timeout": "0.1"}, timeout=1.0
-        )
-        duration = perf_counter() - start
-        assert resp.status_code == 500
-        assert duration <= 0.5
+async def test_timeout(quickapi_server: str, client: AsyncClient):
+    start = perf_counter()
+    resp = await client.get(
+        f"{quickapi_server}/slow", headers={"timeout": "0.1"}, timeout=1.0
+    )
+    duration = perf_counter() - start
+    assert resp.status_code == 500
+    assert duration <= 0.5
@@ -25,8 +25,9 @@ def test_simple_prepare(incanter: Incanter):
     incanter.register_hook(lambda p: p.name == "dep1", lambda: 2)
     assert incanter.compose_and_call(func) == 3
 
-    assert signature(incanter.compose(func)).parameters == {}
-    assert signature(incanter.compose(func)).return_annotation is int
+    sig = signature(incanter.compose(func))
+    assert sig.parameters == {}
+    assert sig.return_annotation is int
 
 
 def test_reg_by_type(incanter: Incanter):
@@ -3,17 +3,18 @@
 Note: this isn't necessarily idiomatic incant usage, just tests
 to prove feature parity.
 """
-from collections import defaultdict
-from typing import List
+from collections import deque
+from functools import lru_cache
+from typing import Deque, Dict, List, Tuple, Type
 
-from attrs import Factory, define
+from attrs import Factory, define, field
 from incant import Incanter
 
 
 def test_greeter(incanter: Incanter):
     """Test the wired scenario from https://wired.readthedocs.io/en/latest/tutorial/simple/index.html"""
 
-    @define
+    @define(eq=False)
     class Greeter:
         greeting: str
 
@@ -32,7 +33,7 @@ def test_greeter(incanter: Incanter):
 def test_greeter_factory(incanter: Incanter):
     """Test the wired scenario from https://wired.readthedocs.io/en/latest/tutorial/factory/index.html"""
 
-    @define
+    @define(eq=False)
     class Greeter:
         greeting: str
 
@@ -52,11 +53,11 @@ def test_greeter_factory(incanter: Incanter):
 def test_greeter_settings() -> None:
     """Test the wired scenario from https://wired.readthedocs.io/en/latest/tutorial/settings/index.html"""
 
-    @define
+    @define(eq=False)
     class Settings:
         punctuation: str
 
-    @define
+    @define(eq=False)
     class Greeter:
         greeting: str
         punctuation: str
@@ -89,7 +90,7 @@ def test_greeter_settings_idiomatic(incanter: Incanter):
     The example is rewritten to be idiomatic incanter.
     """
 
-    @define
+    @define(eq=False)
     class Greeter:
         greeting: str
         punctuation: str
@@ -112,15 +113,15 @@ def test_greeter_settings_idiomatic(incanter: Incanter):
 def test_greeter_contexts(incanter: Incanter):
     """Test the wired scenario from https://wired.readthedocs.io/en/latest/tutorial/context/index.html"""
 
-    @define
+    @define(eq=False)
     class Customer:
         name: str
 
-    @define
+    @define(eq=False)
     class FrenchCustomer(Customer):
         pass
 
-    @define
+    @define(eq=False)
     class Greeter:
         punctuation: str
         greeting: str = "Hello"
@@ -128,7 +129,7 @@ def test_greeter_contexts(incanter: Incanter):
         def __call__(self, customer: Customer) -> str:
             return f"{self.greeting} {customer.name} {self.punctuation}"
 
-    @define
+    @define(eq=False)
     class FrenchGreeter(Greeter):
         greeting: str = "Bonjour"
 
@@ -138,11 +139,16 @@ def test_greeter_contexts(incanter: Incanter):
     def greet_a_customer(customer: Customer, greeter: Greeter):
         return greeter(customer)
 
+    customer_types_to_greeters: Dict[type, Type[Greeter]] = {
+        Customer: Greeter,
+        FrenchCustomer: FrenchGreeter,
+    }
+
     incanter.register_by_name(lambda: "!!", name="punctuation")
     incanter.register_by_type(
-        lambda customer, punctuation: FrenchGreeter(punctuation)
-        if isinstance(customer, FrenchCustomer)
-        else Greeter(punctuation),
+        lambda customer, punctuation: customer_types_to_greeters.get(
+            type(customer), Greeter
+        )(punctuation),
         Greeter,
     )
 
@@ -160,11 +166,11 @@ def test_greeter_decoupled(incanter: Incanter):
     """Test the wired scenario from https://wired.readthedocs.io/en/latest/tutorial/decoupled/index.html"""
 
     # The first part of the app:
-    @define
+    @define(eq=False)
     class Customer:
         name: str
 
-    @define
+    @define(eq=False)
     class Greeter:
         punctuation: str
         greeting: str = "Hello"
@@ -174,10 +180,14 @@ def test_greeter_decoupled(incanter: Incanter):
 
     incanter.register_by_name(lambda: "!!", name="punctuation")
 
-    customer_types_to_greeters = defaultdict(lambda: Greeter)  # type: ignore
+    customer_types_to_greeters: Dict[type, Type[Greeter]] = {}
+
+    @lru_cache(maxsize=None)
+    def resolve_greeter(customer_type: type, punctuation: str) -> Greeter:
+        return customer_types_to_greeters.get(customer_type, Greeter)(punctuation)
 
     def greeter_factory(customer, punctuation) -> Greeter:
-        return customer_types_to_greeters[type(customer)](punctuation)
+        return resolve_greeter(type(customer), punctuation)  # type: ignore
 
     incanter.register_by_type(greeter_factory)
 
@@ -188,11 +198,11 @@ def test_greeter_decoupled(incanter: Incanter):
     assert incanter.compose_and_call(greet_a_customer, customer) == "Hello Mary !!"
 
     # The second part of the app:
-    @define
+    @define(eq=False)
     class FrenchCustomer(Customer):
         pass
 
-    @define
+    @define(eq=False)
     class FrenchGreeter(Greeter):
         greeting: str = "Bonjour"
 
@@ -212,30 +222,41 @@ def test_greeter_datastore(incanter: Incanter):
     """Test the wired scenario from https://wired.readthedocs.io/en/latest/tutorial/datastore/index.html"""
 
     # The first part of the app:
-    @define
+    @define(eq=False)
     class Customer:
         name: str
 
-    @define
+    @define(eq=False)
     class Datastore:
-        customers: List[Customer] = Factory(list)
+        customers: Deque[Customer] = Factory(deque)
 
-    @define
+    @define(eq=False)
     class Greeter:
         punctuation: str
         greeting: str = "Hello"
+        _prefix: str = field(init=False, repr=False)
+        _suffix: str = field(init=False, repr=False)
+
+        def __attrs_post_init__(self) -> None:
+            self._prefix = f"{self.greeting} "
+            self._suffix = f" {self.punctuation}"
 
         def __call__(self, customer: Customer) -> str:
-            return f"{self.greeting} {customer.name} {self.punctuation}"
+            return self._prefix + customer.name + self._suffix
 
     datastore = Datastore()
     incanter.register_by_name(lambda: "!!", name="punctuation")
     incanter.register_by_type(lambda: datastore, Datastore)
 
-    customer_types_to_greeters = defaultdict(lambda: Greeter)  # type: ignore
+    customer_types_to_greeters: Dict[type, Type[Greeter]] = {}
+
+    @lru_cache(maxsize=None)
+    def resolve_greeter(customer_type: type, punctuation: str) -> Greeter:
+        return customer_types_to_greeters.get(customer_type, Greeter)(punctuation)
+
     incanter.register_by_type(
-        lambda customer, punctuation: customer_types_to_greeters[type(customer)](
-            punctuation
+        lambda customer, punctuation: resolve_greeter(
+            type(customer), punctuation  # type: ignore
         ),
         Greeter,
     )
@@ -247,17 +268,14 @@ def test_greeter_datastore(incanter: Incanter):
         return greeter(customer)
 
     # The second part of the app:
-    @define
+    @define(eq=False)
     class FrenchCustomer(Customer):
         pass
 
-    @define
+    @define(eq=False)
     class FrenchGreeter(Greeter):
         greeting: str = "Bonjour"
 
-        def __call__(self, customer: Customer) -> str:
-            return f"{self.greeting} {customer.name} {self.punctuation}"
-
     customer_types_to_greeters[FrenchCustomer] = FrenchGreeter
 
     french_customer = FrenchCustomer(name="Henri")
@@ -270,17 +288,12 @@ def test_greeter_datastore(incanter: Incanter):
     def sample_interactions(incanter: Incanter) -> List[str]:
         """Pretend to do a couple of customer interactions"""
 
-        greetings = []
-
-        def get_customers(datastore: Datastore) -> List[Customer]:
-            return list(datastore.customers)
+        def get_customers(datastore: Datastore) -> Tuple[Customer, ...]:
+            return tuple(datastore.customers)
 
         customers = incanter.compose_and_call(get_customers)
+        interact = incanter.compose(customer_interaction)
 
-        for customer in customers:
-            greeting = incanter.compose_and_call(customer_interaction, customer)
-            greetings.append(greeting)
-
-        return greetings
+        return [interact(customer) for customer in customers]
 
     assert sample_interactions(incanter) == ["Hello Mary !!", "Bonjour Henri !!"]